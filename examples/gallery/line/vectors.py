@@ -0,0 +1,50 @@
+"""
+Cartesian vectors
+-----------------
+
+The :meth:`pygmt.Figure.plot` method can plot Cartesian vectors by passing a
+vector ``style`` ("v" or "V") together with the ``direction`` argument, which
+takes a list of two 1d arrays holding the vector angles and lengths. Because
+whole arrays are accepted, all vectors that share a style, pen, and color can
+be drawn with a single :meth:`pygmt.Figure.plot` call instead of one call per
+vector. Batching like this is also much faster, since every call starts its
+own GMT session.
+"""
+
+import numpy as np
+import pygmt
+
+fig = pygmt.Figure()
+fig.basemap(region=[0, 10, 0, 10], projection="X15c/10c", frame='+t"Vectors"')
+
+# Plot a fan of twelve vectors rotating about a common origin with a single
+# call by passing all angles at once
+angles = np.linspace(start=0, stop=330, num=12)
+lengths = np.full(angles.size, 1.8)
+x = np.full(angles.size, 2.5)
+y = np.full(angles.size, 5)
+fig.plot(
+    x=x,
+    y=y,
+    style="v0.2c+e",
+    direction=[angles, lengths],
+    pen="1p",
+    color="black",
+)
+
+# Vectors at scattered positions also go into one call as long as they share
+# the same style, pen, and color
+x = np.array([6.5, 7.5, 9.0, 7.0, 8.5])
+y = np.array([5.5, 8.0, 6.5, 3.0, 4.5])
+angles = np.array([30, 120, 260, 300, 80])
+lengths = np.array([1.5, 1.0, 2.0, 1.2, 0.8])
+fig.plot(
+    x=x,
+    y=y,
+    style="v0.3c+ea+bc",
+    direction=[angles, lengths],
+    pen="1.5p,red",
+    color="red",
+)
+
+fig.show()
@@ -5,6 +5,7 @@ The path to the shared library can be found automatically by ctypes or set
 through the GMT_LIBRARY_PATH environment variable.
 """
 import ctypes
+import functools
 import os
 import subprocess as sp
 import sys
@@ -12,6 +13,21 @@ from ctypes.util import find_library
 
 from pygmt.exceptions import GMTCLibError, GMTCLibNotFoundError, GMTOSError
 
+# Cache the loaded shared library and its path so that repeated Session
+# creations (one per plot or module call) don't redo the expensive search,
+# which can involve spawning a "gmt --show-library" subprocess.
+_LIBGMT_CACHE = None
+_LIBGMT_PATH = None
+
+# Mapping of sys.platform prefixes to the possible names of GMT's shared
+# library on that operating system.
+_LIBNAMES = {
+    "linux": ["libgmt.so"],
+    "darwin": ["libgmt.dylib"],  # Darwin is macOS
+    "win32": ["gmt.dll", "gmt_w64.dll", "gmt_w32.dll"],
+    "freebsd": ["libgmt.so"],
+}
+
 
 def load_libgmt():
     """
@@ -21,6 +37,9 @@ def load_libgmt():
     the environment variable ``GMT_LIBRARY_PATH``. If it's not set, will let
     ctypes try to find the library.
 
+    The loaded library is cached at module level, so the search for the
+    shared library only happens once per process.
+
     Returns
     -------
     :py:class:`ctypes.CDLL` object
@@ -32,6 +51,10 @@ def load_libgmt():
         If there was any problem loading the library (couldn't find it or
         couldn't access the functions).
     """
+    global _LIBGMT_CACHE, _LIBGMT_PATH  # pylint: disable=global-statement
+    if _LIBGMT_CACHE is not None:
+        return _LIBGMT_CACHE
+
     lib_fullnames = []
     error = True
     for libname in clib_full_names():
@@ -48,13 +71,19 @@ def load_libgmt():
             "Error loading the GMT shared library "
             f"{', '.join(lib_fullnames)}.\n {error}."
         )
+    _LIBGMT_CACHE = libgmt
+    _LIBGMT_PATH = libname
     return libgmt
 
 
+@functools.lru_cache(maxsize=4)
 def clib_names(os_name):
     """
     Return the name of GMT's shared library for the current OS.
 
+    The result is memoized since ``sys.platform`` doesn't change within a
+    process.
+
     Parameters
     ----------
     os_name : str
@@ -65,17 +94,10 @@ def clib_names(os_name):
     libnames : list of str
         List of possible names of GMT's shared library.
     """
-    if os_name.startswith("linux"):
-        libnames = ["libgmt.so"]
-    elif os_name == "darwin":  # Darwin is macOS
-        libnames = ["libgmt.dylib"]
-    elif os_name == "win32":
-        libnames = ["gmt.dll", "gmt_w64.dll", "gmt_w32.dll"]
-    elif os_name.startswith("freebsd"):  # FreeBSD
-        libnames = ["libgmt.so"]
-    else:
-        raise GMTOSError(f'Operating system "{os_name}" not supported.')
-    return libnames
+    for prefix, libnames in _LIBNAMES.items():
+        if os_name.startswith(prefix):
+            return libnames
+    raise GMTOSError(f'Operating system "{os_name}" not supported.')
 
 
 def clib_full_names(env=None):
@@ -102,12 +124,19 @@ def clib_full_names(env=None):
     # Search for libraries in GMT_LIBRARY_PATH if defined.
     libpath = env.get("GMT_LIBRARY_PATH", "")  # e.g. $HOME/miniconda/envs/pygmt/lib
     if libpath:
+        # List the directory once and check membership in a set, instead of
+        # paying one stat() syscall per candidate library name.
+        try:
+            libpath_entries = {entry.name for entry in os.scandir(libpath)}
+        except OSError:  # libpath doesn't exist or is not a directory
+            libpath_entries = set()
         for libname in libnames:
-            libfullpath = os.path.join(libpath, libname)
-            if os.path.exists(libfullpath):
-                yield libfullpath
+            if libname in libpath_entries:
+                yield os.path.join(libpath, libname)
 
-    # Search for the library returned by command "gmt --show-library"
+    # Search for the library returned by command "gmt --show-library".
+    # Since this is a generator, the subprocess is only spawned if the
+    # candidates from GMT_LIBRARY_PATH were missing or failed to load.
     try:
         libfullpath = sp.check_output(
             ["gmt", "--show-library"], encoding="utf-8"
@@ -133,7 +162,9 @@ def check_libgmt(libgmt):
     """
     Make sure that libgmt was loaded correctly.
 
-    Checks if it defines some common required functions.
+    Checks if it defines some common required functions and pins their ctypes
+    signatures (``argtypes``/``restype``) so they are set only once per
+    process instead of on every call.
 
     Does nothing if everything is fine. Raises an exception if any of the
     functions are missing.
@@ -153,3 +184,26 @@ def check_libgmt(libgmt):
         if not hasattr(libgmt, "GMT_" + func):
             msg = f"Error loading libgmt. Couldn't access function GMT_{func}."
             raise GMTCLibError(msg)
+
+    # Pin the argument and return types of the most frequently used functions
+    # up front. Setting these on the CDLL function objects persists for the
+    # lifetime of the library, so each call skips the Python-side signature
+    # assignment that ctypes would otherwise redo.
+    libgmt.GMT_Create_Session.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_uint,
+        ctypes.c_uint,
+        ctypes.c_void_p,
+    ]
+    libgmt.GMT_Create_Session.restype = ctypes.c_void_p
+    libgmt.GMT_Get_Enum.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    libgmt.GMT_Get_Enum.restype = ctypes.c_int
+    libgmt.GMT_Call_Module.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    libgmt.GMT_Call_Module.restype = ctypes.c_int
+    libgmt.GMT_Destroy_Session.argtypes = [ctypes.c_void_p]
+    libgmt.GMT_Destroy_Session.restype = ctypes.c_int
@@ -123,6 +123,12 @@ class Session:
     # The minimum version of GMT required
     required_version = "6.1.1"
 
+    # The GMT_MODULE_CMD mode constant, looked up once on the first
+    # call_module and reused afterwards. It's fixed for a given libgmt, which
+    # is itself cached at module level, so the value never changes within a
+    # process.
+    _module_cmd_mode = None
+
     @property
     def session_pointer(self):
         """
@@ -281,9 +287,13 @@ class Session:
         if not hasattr(self, "_libgmt"):
             self._libgmt = load_libgmt()
         function = getattr(self._libgmt, name)
-        if argtypes is not None:
+        # Assign the signature only if it hasn't been set yet, so it's paid
+        # once per process instead of on every call. Each GMT function is
+        # always requested with the same signature (the core ones are pinned
+        # up front by check_libgmt), so an already-set value can be reused.
+        if argtypes is not None and function.argtypes is None:
             function.argtypes = argtypes
-        if restype is not None:
+        if restype is not None and function.restype is not restype:
             function.restype = restype
         return function
 
@@ -495,7 +505,9 @@ class Session:
             restype=ctp.c_int,
         )
 
-        mode = self["GMT_MODULE_CMD"]
+        if Session._module_cmd_mode is None:
+            Session._module_cmd_mode = self["GMT_MODULE_CMD"]
+        mode = Session._module_cmd_mode
         status = c_call_module(
             self.session_pointer, module.encode(), mode, args.encode()
         )
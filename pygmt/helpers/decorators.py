@@ -261,6 +261,10 @@ def use_alias(**aliases):
         Arguments in short-form (J) and long-form (projection) can't coexist
     """
 
+    # Freeze the alias mapping into a tuple of pairs once at decoration time
+    # so the wrapper doesn't rebuild a dict view on every call.
+    alias_pairs = tuple(aliases.items())
+
     def alias_decorator(module_func):
         """
         Decorator that replaces the aliases for arguments.
@@ -271,12 +275,12 @@ def use_alias(**aliases):
             """
             New module that parses and replaces the registered aliases.
             """
-            for arg, alias in aliases.items():
-                if alias in kwargs and arg in kwargs:
-                    raise GMTInvalidInput(
-                        f"Arguments in short-form ({arg}) and long-form ({alias}) can't coexist"
-                    )
+            for arg, alias in alias_pairs:
                 if alias in kwargs:
+                    if arg in kwargs:
+                        raise GMTInvalidInput(
+                            f"Arguments in short-form ({arg}) and long-form ({alias}) can't coexist"
+                        )
                     kwargs[arg] = kwargs.pop(alias)
             return module_func(*args, **kwargs)
 
@@ -390,6 +394,13 @@ def kwargs_to_strings(convert_bools=True, **conversions):
         "sequence_space": " ",
     }
 
+    # Resolve each conversion type to its separator once at decoration time
+    # (all valid conversions are sequence types) so the wrapper only does a
+    # tuple iteration per call.
+    sequence_conversions = tuple(
+        (arg, separators[fmt]) for arg, fmt in conversions.items()
+    )
+
     # Make the actual decorator function
     def converter(module_func):
         """
@@ -403,11 +414,10 @@ def kwargs_to_strings(convert_bools=True, **conversions):
             """
             if convert_bools:
                 kwargs = remove_bools(kwargs)
-            for arg, fmt in conversions.items():
+            for arg, separator in sequence_conversions:
                 if arg in kwargs:
                     value = kwargs[arg]
-                    issequence = fmt in separators
-                    if issequence and is_nonstr_iter(value):
+                    if is_nonstr_iter(value):
                         for index, item in enumerate(value):
                             try:
                                 # check if there is a space " " when converting
@@ -420,7 +430,7 @@ def kwargs_to_strings(convert_bools=True, **conversions):
                                 value[index] = np.datetime_as_string(
                                     np.asarray(item, dtype=np.datetime64)
                                 )
-                        kwargs[arg] = separators[fmt].join(f"{item}" for item in value)
+                        kwargs[arg] = separator.join(f"{item}" for item in value)
             # Execute the original function and return its output
             return module_func(*args, **kwargs)
 
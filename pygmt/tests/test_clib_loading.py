@@ -5,6 +5,7 @@ import subprocess
 import sys
 
 import pytest
+from pygmt.clib import loading
 from pygmt.clib.loading import check_libgmt, clib_names, load_libgmt
 from pygmt.exceptions import GMTCLibError, GMTCLibNotFoundError, GMTOSError
 
@@ -31,6 +32,7 @@ def test_load_libgmt_fails(monkeypatch):
     be found.
     """
     with monkeypatch.context() as mpatch:
+        mpatch.setattr(loading, "_LIBGMT_CACHE", None)  # bypass the cache
         mpatch.setattr(sys, "platform", "win32")  # pretend to be on Windows
         mpatch.setattr(
             subprocess, "check_output", lambda cmd, encoding: "libfakegmt.so"
@@ -43,11 +45,25 @@ def test_load_libgmt_with_a_bad_library_path(monkeypatch):
     """
     Test that loading still works when given a bad library path.
     """
-    # Set a fake "GMT_LIBRARY_PATH"
+    # Set a fake "GMT_LIBRARY_PATH" and bypass the cache
+    monkeypatch.setattr(loading, "_LIBGMT_CACHE", None)
     monkeypatch.setenv("GMT_LIBRARY_PATH", "/not/a/real/path")
     assert check_libgmt(load_libgmt()) is None
 
 
+def test_load_libgmt_with_a_broken_library_in_path(monkeypatch, tmp_path):
+    """
+    Test that loading falls back to the other candidates when
+    GMT_LIBRARY_PATH has a library that exists but cannot be loaded.
+    """
+    # Create fake, unloadable libraries with the expected names
+    for libname in clib_names(sys.platform):
+        (tmp_path / libname).write_text("not a shared library")
+    monkeypatch.setattr(loading, "_LIBGMT_CACHE", None)  # bypass the cache
+    monkeypatch.setenv("GMT_LIBRARY_PATH", str(tmp_path))
+    assert check_libgmt(load_libgmt()) is None
+
+
 def test_clib_names():
     """
     Make sure we get the correct library name for different OS names.
@@ -13,6 +13,7 @@ from pygmt import x2sys_cross, x2sys_init
 from pygmt.datasets import load_sample_bathymetry
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import data_kind
+from pygmt.x2sys import _import_pyarrow, tempfile_from_dftrack
 
 
 @pytest.fixture(name="mock_x2sys_home")
@@ -34,6 +35,30 @@ def fixture_tracks():
     return [dataframe.query(expr="z > -20")]  # reduce size of dataset
 
 
+def test_tempfile_from_dftrack_pyarrow_matches_pandas(monkeypatch):
+    """
+    Check that the pyarrow and pandas write paths of tempfile_from_dftrack
+    produce identical track files.
+    """
+    if _import_pyarrow() is None:
+        pytest.skip("requires pyarrow")
+
+    np.random.seed(seed=42)
+    track = pd.DataFrame(data=np.random.rand(10, 3), columns=("x", "y", "z"))
+    track["time"] = pd.date_range(start="2020-01-01", periods=10, freq="ms")
+
+    with tempfile_from_dftrack(track=track, suffix="xyzt") as tmpfilename:
+        with open(tmpfilename, mode="rb") as tmpfile:
+            pyarrow_content = tmpfile.read()
+    with monkeypatch.context() as mpatch:
+        mpatch.setattr("pygmt.x2sys._import_pyarrow", lambda: None)
+        with tempfile_from_dftrack(track=track, suffix="xyzt") as tmpfilename:
+            with open(tmpfilename, mode="rb") as tmpfile:
+                pandas_content = tmpfile.read()
+
+    assert pyarrow_content == pandas_content
+
+
 def test_x2sys_cross_input_file_output_file(mock_x2sys_home):
     """
     Run x2sys_cross by passing in a filename, and output internal crossovers to
@@ -129,6 +154,41 @@ def test_x2sys_cross_input_two_dataframes(mock_x2sys_home):
         assert output.dtypes["t_2"].type == np.datetime64
 
 
+def test_x2sys_cross_input_two_dataframes_njobs(mock_x2sys_home):
+    """
+    Run x2sys_cross on two pandas.DataFrame tables with njobs=2, and check
+    that the crossovers match the single-process result up to row order.
+    """
+    with TemporaryDirectory(prefix="X2SYS", dir=os.getcwd()) as tmpdir:
+        tag = os.path.basename(tmpdir)
+        x2sys_init(
+            tag=tag, fmtfile="xyz", suffix="xyzt", units=["de", "se"], force=True
+        )
+
+        # Add a time row to the x2sys fmtfile
+        with open(file=os.path.join(tmpdir, "xyz.fmt"), mode="a") as fmtfile:
+            fmtfile.write("time\ta\tN\t0\t1\t0\t%g\n")
+
+        # Create pandas.DataFrame track tables
+        tracks = []
+        for i in range(2):
+            np.random.seed(seed=i)
+            track = pd.DataFrame(data=np.random.rand(10, 3), columns=("x", "y", "z"))
+            track["time"] = pd.date_range(start=f"2020-{i}1-01", periods=10, freq="ms")
+            tracks.append(track)
+
+        serial = x2sys_cross(tracks=tracks, tag=tag, coe="e", verbose="i")
+        parallel = x2sys_cross(tracks=tracks, tag=tag, coe="e", njobs=2, verbose="i")
+
+        assert isinstance(parallel, pd.DataFrame)
+        assert parallel.shape == serial.shape
+        sort_columns = list(serial.columns)
+        pd.testing.assert_frame_equal(
+            serial.sort_values(by=sort_columns, ignore_index=True),
+            parallel.sort_values(by=sort_columns, ignore_index=True),
+        )
+
+
 def test_x2sys_cross_input_two_filenames(mock_x2sys_home):
     """
     Run x2sys_cross by passing in two filenames, and output external crossovers
@@ -2,10 +2,14 @@
 GMT supplementary X2SYS module for crossover analysis.
 """
 import contextlib
+import itertools
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from packaging.version import Version
 from pygmt.clib import Session
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import (
@@ -20,6 +24,27 @@ from pygmt.helpers import (
 )
 
 
+def _import_pyarrow():
+    """
+    Import and return the pyarrow module, or ``None`` if a usable version is
+    not installed.
+
+    Requires pyarrow >= 8.0, where ``csv.WriteOptions`` supports the
+    ``delimiter`` and ``quoting_style`` options used here. Deferred to first
+    use so that ``import pygmt`` doesn't pay pyarrow's import cost; the
+    x2sys functions are the only users. Repeated calls are cheap since
+    Python caches imported modules.
+    """
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        import pyarrow.csv  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return None
+    if Version(pa.__version__) < Version("8.0"):
+        return None
+    return pa
+
+
 @contextlib.contextmanager
 def tempfile_from_dftrack(track, suffix):
     """
@@ -43,12 +68,45 @@ def tempfile_from_dftrack(track, suffix):
     """
     try:
         tmpfilename = f"track-{unique_name()[:7]}.{suffix}"
-        track.to_csv(
-            path_or_buf=tmpfilename,
-            sep="\t",
-            index=False,
-            date_format="%Y-%m-%dT%H:%M:%S.%fZ",
-        )
+        pa = _import_pyarrow()
+        if pa is not None:
+            # Use pyarrow's C++ CSV writer, which is much faster than
+            # pandas.DataFrame.to_csv on large numeric tables. Datetime
+            # columns are formatted up front so the output matches the
+            # to_csv fallback below. numpy.datetime_as_string with
+            # timezone="UTC" yields "%Y-%m-%dT%H:%M:%S.%fZ" in a single
+            # vectorized pass, instead of calling strftime once per row.
+            datetime_cols = track.select_dtypes(include="datetime").columns
+            if len(datetime_cols) > 0:
+                track = track.assign(
+                    **{
+                        col: np.datetime_as_string(
+                            track[col].to_numpy(), unit="us", timezone="UTC"
+                        )
+                        for col in datetime_cols
+                    }
+                )
+            # Arrow quotes every string cell and all header names no matter
+            # the quoting_style, which neither to_csv nor GMT's x2sys
+            # readers expect. Write the header line ourselves and disable
+            # quoting entirely; track fields never contain tabs or newlines
+            # (Arrow raises if one would need escaping).
+            with open(tmpfilename, "wb") as tmpfile:
+                tmpfile.write(("\t".join(track.columns) + "\n").encode())
+                pa.csv.write_csv(
+                    pa.Table.from_pandas(track, preserve_index=False),
+                    tmpfile,
+                    write_options=pa.csv.WriteOptions(
+                        delimiter="\t", include_header=False, quoting_style="none"
+                    ),
+                )
+        else:
+            track.to_csv(
+                path_or_buf=tmpfilename,
+                sep="\t",
+                index=False,
+                date_format="%Y-%m-%dT%H:%M:%S.%fZ",
+            )
         yield tmpfilename
     finally:
         os.remove(tmpfilename)
@@ -178,7 +236,7 @@ def x2sys_init(tag, **kwargs):
     Z="trackvalues",
 )
 @kwargs_to_strings(R="sequence")
-def x2sys_cross(tracks=None, outfile=None, **kwargs):
+def x2sys_cross(tracks=None, outfile=None, njobs=1, **kwargs):
     r"""
     Calculate crossovers between track data files.
 
@@ -214,6 +272,18 @@ def x2sys_cross(tracks=None, outfile=None, **kwargs):
         Optional. The file name for the output ASCII txt file to store the
         table in.
 
+    njobs : int
+        Number of worker processes to compute crossovers with [Default is 1,
+        i.e. a single GMT call with all tracks]. If larger than 1, the track
+        combinations are split one pair (or one track, for internal
+        crossovers) per task across ``njobs`` processes and the resulting
+        tables are concatenated. This automates the split-into-sub-processes
+        workflow described under ``runtimes``. Only used when ``outfile`` is
+        not set and ``combitable`` is not given. Note that each
+        pandas.DataFrame track is serialized to a temporary file in every
+        task it appears in, so with many large in-memory tracks it can be
+        faster to save them to disk once and pass filenames instead.
+
     tag : str
         Specify the x2sys TAG which identifies the attributes of this data
         type.
@@ -295,26 +365,66 @@ def x2sys_cross(tracks=None, outfile=None, **kwargs):
         - pandas.DataFrame table with (x, y, ..., etc) if outfile is not set
         - None if outfile is set (track output will be stored in outfile)
     """
+    if (
+        njobs > 1
+        and outfile is None
+        and "A" not in kwargs
+        and isinstance(tracks, (list, tuple))  # a bare str track can't be paired
+        and len(tracks) > 1
+    ):
+        return _x2sys_cross_parallel(tracks=tracks, njobs=njobs, kwargs=kwargs)
+
+    # Classify each track once up front, and shallow-copy DataFrame tracks
+    # whose columns aren't backed by contiguous buffers (e.g. row-sliced
+    # frames) so the vectorized serialization in tempfile_from_dftrack gets a
+    # single dense buffer per column.
+    kinds = [data_kind(track) for track in tracks]
+    tracks = [
+        track.copy(deep=False) if kind == "matrix" else track
+        for track, kind in zip(tracks, kinds)
+    ]
+    for track, kind in zip(tracks, kinds):
+        if kind == "matrix":
+            for col in track.columns:
+                values = track[col].to_numpy()
+                if not values.flags["C_CONTIGUOUS"]:
+                    track[col] = np.ascontiguousarray(values)
+
     with Session() as lib:
         file_contexts = []
-        for track in tracks:
-            kind = data_kind(track)
+        suffix = None  # track file suffix, parsed once from the TAG file
+        for track, kind in zip(tracks, kinds):
             if kind == "file":
                 file_contexts.append(dummy_context(track))
             elif kind == "matrix":
-                # find suffix (-E) of trackfiles used (e.g. xyz, csv, etc) from
-                # $X2SYS_HOME/TAGNAME/TAGNAME.tag file
-                lastline = (
-                    Path(os.environ["X2SYS_HOME"], kwargs["T"], f"{kwargs['T']}.tag")
-                    .read_text()
-                    .strip()
-                    .split("\n")[-1]
-                )  # e.g. "-Dxyz -Etsv -I1/1"
-                for item in sorted(lastline.split()):  # sort list alphabetically
-                    if item.startswith(("-E", "-D")):  # prefer -Etsv over -Dxyz
-                        suffix = item[2:]  # e.g. tsv (1st choice) or xyz (2nd choice)
-
-                # Save pandas.DataFrame track data to temporary file
+                if suffix is None:
+                    # find suffix (-E) of trackfiles used (e.g. xyz, csv, etc)
+                    # from $X2SYS_HOME/TAGNAME/TAGNAME.tag file. The TAG file
+                    # is the same for every track, so it's read and parsed
+                    # only for the first matrix-kind track.
+                    lastline = (
+                        Path(
+                            os.environ["X2SYS_HOME"], kwargs["T"], f"{kwargs['T']}.tag"
+                        )
+                        .read_text()
+                        .strip()
+                        .split("\n")[-1]
+                    )  # e.g. "-Dxyz -Etsv -I1/1"
+                    tag_items = lastline.split()
+                    # prefer the -Etsv suffix over the -Dxyz format name
+                    suffix = next(
+                        (item[2:] for item in tag_items if item.startswith("-E")), None
+                    ) or next(
+                        (item[2:] for item in tag_items if item.startswith("-D")), None
+                    )
+
+                # Save pandas.DataFrame track data to temporary file. A real
+                # file (rather than a virtual file from
+                # virtualfile_from_vectors) is required here because
+                # x2sys_cross reads the tracks through x2sys's own
+                # format-definition readers, which select the parser from the
+                # file suffix registered in the TAG and bypass GMT's
+                # virtual-file machinery entirely.
                 file_contexts.append(tempfile_from_dftrack(track=track, suffix=suffix))
             else:
                 raise GMTInvalidInput(f"Unrecognized data type: {type(track)}")
@@ -324,7 +434,7 @@ def x2sys_cross(tracks=None, outfile=None, **kwargs):
                 fnames = [stack.enter_context(c) for c in file_contexts]
                 if outfile is None:
                     outfile = tmpfile.name
-                arg_str = " ".join([*fnames, build_arg_string(kwargs), "->" + outfile])
+                arg_str = f"{' '.join(fnames)} {build_arg_string(kwargs)} ->{outfile}"
                 lib.call_module(module="x2sys_cross", args=arg_str)
 
             # Read temporary csv output to a pandas table
@@ -343,3 +453,47 @@ def x2sys_cross(tracks=None, outfile=None, **kwargs):
                 table = None
 
     return table
+
+
+def _x2sys_cross_parallel(tracks, njobs, kwargs):
+    """
+    Compute crossovers for the given tracks in parallel worker processes.
+
+    External crossovers are calculated one track pair per task and internal
+    crossovers one track per task (honoring the ``coe`` selection in
+    *kwargs*), so no combination is duplicated between workers. Each worker
+    runs :func:`x2sys_cross` on its subset and the tables are concatenated in
+    submission order. Since every task serializes its own inputs, a
+    pandas.DataFrame track is written to a temporary file once per task it
+    appears in (its N-1 pairs plus its internal-crossover task).
+
+    Parameters
+    ----------
+    tracks : list
+        The tracks passed to :func:`x2sys_cross`.
+    njobs : int
+        Number of worker processes.
+    kwargs : dict
+        The short-form keyword arguments of the :func:`x2sys_cross` call.
+
+    Returns
+    -------
+    crossover_errors : pandas.DataFrame
+        The concatenated crossover error tables from all workers.
+    """
+    coe = kwargs.get("Q", "")
+    other_kwargs = {key: value for key, value in kwargs.items() if key != "Q"}
+
+    subsets = []
+    if coe != "i":  # external COEs come from one pair of tracks per task
+        subsets.extend((list(pair), "e") for pair in itertools.combinations(tracks, 2))
+    if coe != "e":  # internal COEs come from one single track per task
+        subsets.extend(([track], "i") for track in tracks)
+
+    with ProcessPoolExecutor(max_workers=njobs) as executor:
+        futures = [
+            executor.submit(x2sys_cross, tracks=subset, Q=coe_mode, **other_kwargs)
+            for subset, coe_mode in subsets
+        ]
+        tables = [future.result() for future in futures]
+    return pd.concat(tables, ignore_index=True)